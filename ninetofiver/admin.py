@@ -7,15 +7,16 @@ from admin_auto_filters.filters import AutocompleteFilterFactory
 from adminsortable.admin import SortableAdmin
 from django import forms
 from django.contrib import admin, messages
-from django.contrib.admin import widgets
 from django.contrib.auth import models as auth_models
 from django.contrib.auth.admin import GroupAdmin as BaseGroupAdmin
 from django.contrib.auth.models import User
 from django.core.cache import cache
-from django.db.models import Q, Prefetch, TextField, Min
+from django.db import transaction
+from django.db.models import Count, Q, TextField
 from django.forms import TextInput
 from django.urls import reverse
-from django.utils.html import format_html
+from django.utils import timezone
+from django.utils.html import format_html, format_html_join
 from django.utils.translation import gettext as _
 from django_admin_listfilter_dropdown.filters import DropdownFilter
 from django_admin_listfilter_dropdown.filters import RelatedDropdownFilter
@@ -30,10 +31,11 @@ from polymorphic.admin import PolymorphicParentModelAdmin
 from rangefilter.filter import DateRangeFilter
 from rangefilter.filter import DateTimeRangeFilter
 from django.shortcuts import render
+from dal import autocomplete
 from django_select2 import forms as select2_widgets
 from django.utils.safestring import mark_safe
 
-from ninetofiver import models, redmine
+from ninetofiver import models, notifications
 from ninetofiver.filters import CompanyFilter
 from ninetofiver.models import Timesheet, Contract
 from ninetofiver.templatetags.markdown import markdown
@@ -50,11 +52,21 @@ admin.site.enable_nav_sidebar = False
 class GroupForm(forms.ModelForm):
     """Group form."""
 
+    def __init__(self, *args, **kwargs):
+        """Constructor."""
+        super().__init__(*args, **kwargs)
+
+        if self.instance.pk:
+            # Only fetch the PKs - full user rows are of no use here
+            self.fields['users'].initial = list(self.instance.user_set.values_list('pk', flat=True))
+
     users = forms.ModelMultipleChoiceField(
         label=_('Users'),
         required=False,
         queryset=auth_models.User.objects.all(),
-        widget=admin.widgets.FilteredSelectMultiple('users', is_stacked=False)
+        # Fetch users on demand through select2 instead of rendering an
+        # <option> per user in the page
+        widget=autocomplete.ModelSelect2Multiple(url='user-autocomplete')
     )
 
     class Meta:
@@ -75,13 +87,6 @@ class GroupAdmin(BaseGroupAdmin):
         super(GroupAdmin, self).save_model(request, obj, form, change)
         obj.user_set.set(form.cleaned_data['users'])
 
-    def get_form(self, request, obj=None, **kwargs):
-        """Get the form."""
-        pks = [x.pk for x in obj.user_set.all()] if obj else []
-        self.form.base_fields['users'].initial = pks
-
-        return GroupForm
-
 
 # Unregister previous admin to register current one
 admin.site.unregister(auth_models.Group)
@@ -93,6 +98,7 @@ class ApiKeyAdmin(admin.ModelAdmin):
     """Api key admin."""
 
     list_display = ('__str__', 'name', 'key', 'read_only', 'user', 'created_at')
+    list_select_related = ('user',)
     ordering = ('-created_at',)
 
 
@@ -110,15 +116,31 @@ class EmploymentContractStatusFilter(admin.SimpleListFilter):
         )
 
     def queryset(self, request, queryset):
+        today = date.today()
+
         if self.value() == 'active':
             return queryset.filter(
-                Q(started_at__lte=date.today()) &
-                (Q(ended_at__gte=date.today()) | Q(ended_at__isnull=True))
+                Q(started_at__lte=today) &
+                (Q(ended_at__gte=today) | Q(ended_at__isnull=True))
             )
         elif self.value() == 'ended':
-            return queryset.filter(ended_at__lte=date.today())
+            return queryset.filter(ended_at__lte=today)
         elif self.value() == 'future':
-            return queryset.filter(started_at__gte=date.today())
+            return queryset.filter(started_at__gte=today)
+
+
+class CachedPolymorphicChildModelFilter(PolymorphicChildModelFilter):
+    """Polymorphic child model filter which only computes its choices once per admin."""
+
+    _lookup_cache = {}
+
+    def lookups(self, request, model_admin):
+        cached = self._lookup_cache.get(model_admin.__class__)
+        if cached is None:
+            # The child models never change at runtime, so resolve their
+            # content types once instead of on every changelist render
+            cached = self._lookup_cache[model_admin.__class__] = tuple(super().lookups(request, model_admin))
+        return cached
 
 
 class ContractStatusFilter(admin.SimpleListFilter):
@@ -135,16 +157,18 @@ class ContractStatusFilter(admin.SimpleListFilter):
         )
 
     def queryset(self, request, queryset):
+        today = date.today()
+
         if self.value() == 'active':
             return queryset.filter(
-                Q(starts_at__lte=date.today()) &
-                (Q(ends_at__gte=date.today()) | Q(ends_at__isnull=True)) &
+                Q(starts_at__lte=today) &
+                (Q(ends_at__gte=today) | Q(ends_at__isnull=True)) &
                 Q(active=True)
             )
         elif self.value() == 'ended':
-            return queryset.filter(Q(ends_at__lte=date.today()) | Q(active=False))
+            return queryset.filter(Q(ends_at__lte=today) | Q(active=False))
         elif self.value() == 'future':
-            return queryset.filter(starts_at__gte=date.today())
+            return queryset.filter(starts_at__gte=today)
 
 
 @admin.register(models.Company)
@@ -152,7 +176,7 @@ class CompanyAdmin(admin.ModelAdmin):
     """Company admin."""
 
     def logo(obj):
-        return format_html('<a href="%s">%s</a>' % (obj.get_logo_url(), _('Link')))
+        return format_html('<a href="{}">{}</a>', obj.get_logo_url(), _('Link'))
 
     list_display = ('__str__', 'name', 'vat_identification_number', 'address', 'country', 'internal', logo)
     ordering = ('-internal', 'name')
@@ -170,6 +194,7 @@ class EmploymentContractTypeAdmin(admin.ModelAdmin):
 @admin.register(models.EmploymentContract)
 class EmploymentContractAdmin(admin.ModelAdmin):
     list_display = ('user', 'company', 'employment_contract_type', 'work_schedule', 'started_at', 'ended_at')
+    list_select_related = ('user', 'company', 'employment_contract_type', 'work_schedule')
     list_filter = (
         EmploymentContractStatusFilter,
         AutocompleteFilterFactory('User', 'user'),
@@ -178,8 +203,7 @@ class EmploymentContractAdmin(admin.ModelAdmin):
         ('started_at', DateRangeFilter),
         ('ended_at', DateRangeFilter)
     )
-    search_fields = ('user__username', 'user__first_name', 'user__last_name', 'employment_contract_type__name',
-                     'started_at', 'ended_at')
+    search_fields = ('user__username', 'user__first_name', 'user__last_name', 'employment_contract_type__name')
     ordering = ('user__first_name', 'user__last_name')
     autocomplete_fields = ('user', 'company', 'employment_contract_type',)
 
@@ -193,6 +217,7 @@ class WorkScheduleAdmin(admin.ModelAdmin):
 @admin.register(models.UserRelative)
 class UserRelativeAdmin(admin.ModelAdmin):
     list_display = ('__str__', 'name', 'user', 'relation', 'gender', 'birth_date',)
+    list_select_related = ('user',)
     ordering = ('name',)
     autocomplete_fields = ('user',)
 
@@ -200,9 +225,11 @@ class UserRelativeAdmin(admin.ModelAdmin):
 @admin.register(models.Attachment)
 class AttachmentAdmin(admin.ModelAdmin):
     def link(self, obj):
-        return format_html('<a href="%s">%s</a>' % (obj.get_file_url(), str(obj)))
+        return format_html('<a href="{}">{}</a>', obj.get_file_url(), str(obj))
 
     list_display = ('__str__', 'user', 'name', 'description', 'file', 'slug', 'link')
+    list_select_related = ('user',)
+    show_full_result_count = False
 
 
 @admin.register(models.Holiday)
@@ -247,9 +274,8 @@ class LeaveAdmin(admin.ModelAdmin):
         return (
             super().get_queryset(request)
             .select_related('leave_type', 'user')
-            .prefetch_related('attachments')
-            .annotate(_first_day=Min("leavedate__starts_at"))
-            .order_by('_first_day')
+            .prefetch_related('leavedate_set', 'attachments')
+            .order_by('min_starts_at')
         )
 
     def get_formsets_with_inlines(self, request, obj=None):
@@ -267,30 +293,40 @@ class LeaveAdmin(admin.ModelAdmin):
 
     def make_approved(self, request, queryset):
         """Approve selected leaves."""
-        for leave in queryset:
-            leave.status = models.STATUS_APPROVED
-            leave.save(validate=False)
+        self._set_status(queryset, models.STATUS_APPROVED)
 
     make_approved.short_description = _('Approve selected leaves')
 
     def make_rejected(self, request, queryset):
         """Reject selected leaves."""
-        for leave in queryset:
-            leave.status = models.STATUS_REJECTED
-            leave.save(validate=False)
+        self._set_status(queryset, models.STATUS_REJECTED)
 
     make_rejected.short_description = _('Reject selected leaves')
 
+    def _set_status(self, queryset, status):
+        """Set the status of the selected leaves and notify their users."""
+        # Materialize the changed leaves up front so the notification emails
+        # read user/leave dates from cache instead of querying per leave
+        leaves = list(queryset.exclude(status=status)
+                      .select_related('user', 'leave_type')
+                      .prefetch_related('leavedate_set'))
+        queryset.update(status=status, updated_at=timezone.now())
+
+        for leave in leaves:
+            leave.status = status
+        notifications.send_leave_status_notifications(leaves)
+
     def date(self, obj):
         """List leave dates."""
-        return format_html('<br>'.join(x.html_label() for x in list(obj.leavedate_set.all())))
+        # html_label() intentionally returns markup, so mark it safe per item
+        return format_html_join(mark_safe('<br>'), '{}', ((mark_safe(x.html_label()),) for x in obj.leavedate_set.all()))
 
-    date.admin_order_field = "_first_day"
+    date.admin_order_field = "min_starts_at"
 
     def attachment(self, obj):
         """Attachment URLs."""
-        return format_html('<br>'.join('<a href="%s">%s</a>'
-                                       % (x.get_file_url(), str(x)) for x in list(obj.attachments.all())))
+        return format_html_join(mark_safe('<br>'), '<a href="{}">{}</a>',
+                                ((x.get_file_url(), str(x)) for x in obj.attachments.all()))
 
     def company(self, obj):
         """Company under which is user employed. If he is employed under more than one,
@@ -335,11 +371,11 @@ WHERE ninetofiver_leave.user_id = {obj.user_id};
         AutocompleteFilterFactory('User', 'user'),
         CompanyFilter,
         ('user__groups', RelatedDropdownFilter),
-        ('leavedate__starts_at', DateTimeRangeFilter),
-        ('leavedate__ends_at', DateTimeRangeFilter)
+        ('min_starts_at', DateTimeRangeFilter),
+        ('max_ends_at', DateTimeRangeFilter)
     )
     search_fields = ('user__username', 'user__first_name', 'user__last_name', 'leave_type__name', 'status',
-                     'leavedate__starts_at', 'leavedate__ends_at', 'description',)
+                     'description',)
     inlines = [
         LeaveDateInline,
     ]
@@ -356,6 +392,11 @@ WHERE ninetofiver_leave.user_id = {obj.user_id};
 @admin.register(models.LeaveDate)
 class LeaveDateAdmin(admin.ModelAdmin):
 
+    def get_queryset(self, request):
+        # The joined leave is only rendered through __str__, so its description
+        # never makes it onto the changelist
+        return super().get_queryset(request).defer('leave__description')
+
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         """Form field for foreign key."""
         if db_field.name == 'user':
@@ -363,6 +404,9 @@ class LeaveDateAdmin(admin.ModelAdmin):
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
     list_display = ('__str__', 'leave', 'starts_at', 'ends_at')
+    list_select_related = ('leave', 'leave__leave_type', 'leave__user')
+    list_per_page = 50
+    show_full_result_count = False
     ordering = ('-starts_at',)
     raw_id_fields = ('leave', 'timesheet')
     autocomplete_fields = ('timesheet',)
@@ -376,6 +420,9 @@ class UserInfoForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         
         if "redmine_id" in self.fields:
+            # Import here so workers without redmine traffic skip loading redminelib
+            from ninetofiver import redmine
+
             self.fields['redmine_id'].label = 'Redmine user'
             redmine_user_choices = cache.get_or_set('user_info_admin_redmine_id_choices',
                                                     redmine.get_redmine_user_choices)
@@ -384,11 +431,14 @@ class UserInfoForm(forms.ModelForm):
 
 @admin.register(models.UserInfo)
 class UserInfoAdmin(admin.ModelAdmin):
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user').prefetch_related('user__groups')
+
     def join_date(self, obj):
         return obj.get_join_date()
 
     def user_groups(self, obj):
-        return format_html('<br>'.join(str(x) for x in list(obj.user.groups.all())))
+        return format_html_join(mark_safe('<br>'), '{}', ((str(x),) for x in obj.user.groups.all()))
 
     list_display = ('__str__', 'user', 'gender', 'birth_date', 'user_groups', 'country', 'join_date')
     list_filter = ('gender', 'user__groups', ('country', CountryFilter))
@@ -460,6 +510,8 @@ class ContractForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         
         if "redmine_id" in self.fields:
+            from ninetofiver import redmine
+
             self.fields['redmine_id'].label = 'Redmine project'
             redmine_project_choices = cache.get_or_set('contract_admin_redmine_id_choices',
                                                     redmine.get_redmine_project_choices)
@@ -524,29 +576,28 @@ class ContractParentAdmin(ExportMixin, PolymorphicParentModelAdmin):
     """Contract parent admin."""
 
     def get_queryset(self, request):
+        # The changelist only shows counts for the related sets, so a single
+        # aggregation query replaces the per-row prefetches
         return (super().get_queryset(request)
                 .select_related('company', 'customer')
                 .prefetch_related('contractusergroup_set',
-                                  'contractusergroup_set__group', 'contractusergroup_set__contract_role',
-                                  'contractuser_set', 'contractuser_set__user',
-                                  'contractuser_set__contract_role',
-                                  Prefetch('performance_types', queryset=(models.PerformanceType.objects
-                                                                          .non_polymorphic())),
-                                  Prefetch('attachments', queryset=(models.Attachment.objects
-                                                                    .non_polymorphic()))))
+                                  'contractusergroup_set__group', 'contractusergroup_set__contract_role')
+                .annotate(contract_user_count=Count('contractuser', distinct=True),
+                          performance_type_count=Count('performance_types', distinct=True),
+                          attachment_count=Count('attachments', distinct=True)))
 
     def contract_users(obj):
-        return format_html('<br>'.join(str(x) for x in list(obj.contractuser_set.all())))
+        return format_html('<a href="{}?contract__id__exact={}">{}</a>',
+                           reverse('admin:ninetofiver_contractuser_changelist'), obj.id, obj.contract_user_count)
 
     def contract_user_groups(obj):
-        return format_html('<br>'.join(str(x) for x in list(obj.contractusergroup_set.all())))
+        return format_html_join(mark_safe('<br>'), '{}', ((str(x),) for x in obj.contractusergroup_set.all()))
 
     def performance_type(obj):
-        return format_html('<br>'.join(str(x) for x in list(obj.performance_types.all())))
+        return obj.performance_type_count
 
     def attachments(obj):
-        return format_html('<br>'.join('<a href="%s">%s</a>'
-                                       % (x.get_file_url(), str(x)) for x in list(obj.attachments.all())))
+        return obj.attachment_count
 
     def fixed_fee(obj):
         real_obj = obj.get_real_instance()
@@ -595,7 +646,7 @@ class ContractParentAdmin(ExportMixin, PolymorphicParentModelAdmin):
                     duration, day_rate, item_actions)
 
     list_filter = (
-        PolymorphicChildModelFilter,
+        CachedPolymorphicChildModelFilter,
         ContractStatusFilter,
         AutocompleteFilterFactory('company', 'company'),
         AutocompleteFilterFactory('customer', 'customer'),
@@ -622,10 +673,10 @@ class ContractChildAdmin(PolymorphicChildModelAdmin):
                 .select_related('company', 'customer')
                 .prefetch_related('contractusergroup_set',
                                   'contractusergroup_set__group', 'contractusergroup_set__contract_role',
-                                  'contractuser_set', 'contractuser_set__user',
-                                  'contractuser_set__contract_role',
-                                  'attachments', 'performance_types',
-                                  ).distinct())
+                                  ).distinct()
+                .annotate(contract_user_count=Count('contractuser', distinct=True),
+                          performance_type_count=Count('performance_types', distinct=True),
+                          attachment_count=Count('attachments', distinct=True)))
 
     inlines = [
         ContractLogInline,
@@ -681,7 +732,11 @@ class ContractUserWorkScheduleInline(admin.TabularInline):
 
 @admin.register(models.ContractUser)
 class ContractUserAdmin(admin.ModelAdmin):
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('contract__description')
+
     list_display = ('__str__', 'user', 'contract', 'contract_role')
+    list_select_related = ('user', 'contract', 'contract__customer', 'contract_role')
     ordering = ('user__first_name', 'user__last_name')
     inlines = [
         ContractUserWorkScheduleInline,
@@ -699,32 +754,42 @@ class ContractUserAdmin(admin.ModelAdmin):
 class TimesheetAdmin(admin.ModelAdmin):
     """Timesheet admin."""
 
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Get the queryset."""
         return super().get_queryset(request).select_related('user').prefetch_related('attachments')
 
     def attachments(obj):
-        return format_html('<br>'.join('<a href="%s">%s</a>'
-                                       % (x.get_file_url(), str(x)) for x in list(obj.attachments.all())))
+        return format_html_join(mark_safe('<br>'), '<a href="{}">{}</a>',
+                                ((x.get_file_url(), str(x)) for x in obj.attachments.all()))
 
     def make_closed(self, request, queryset):
-        for timesheet in queryset:
-            timesheet.status = models.STATUS_CLOSED
-            timesheet.save(validate=False)
+        with transaction.atomic():
+            count = queryset.update(status=models.STATUS_CLOSED, updated_at=timezone.now())
+        self.message_user(request, _('%(count)d timesheets were updated') % {'count': count})
 
     make_closed.short_description = _('Close selected timesheets')
 
     def make_active(self, request, queryset):
-        for timesheet in queryset:
+        # Reopened pending timesheets get a notification, so materialize them
+        # before the update rewrites their status
+        timesheets = list(queryset.filter(status=models.STATUS_PENDING).select_related('user'))
+        with transaction.atomic():
+            count = queryset.update(status=models.STATUS_ACTIVE, updated_at=timezone.now())
+
+        for timesheet in timesheets:
             timesheet.status = models.STATUS_ACTIVE
-            timesheet.save(validate=False)
+        notifications.send_timesheet_status_notifications(timesheets)
+
+        self.message_user(request, _('%(count)d timesheets were updated') % {'count': count})
 
     make_active.short_description = _('Activate selected timesheets')
 
     def make_pending(self, request, queryset):
-        for timesheet in queryset:
-            timesheet.status = models.STATUS_PENDING
-            timesheet.save(validate=False)
+        with transaction.atomic():
+            count = queryset.update(status=models.STATUS_PENDING, updated_at=timezone.now())
+        self.message_user(request, _('%(count)d timesheets were updated') % {'count': count})
 
     make_pending.short_description = _('Set selected timesheets to pending')
 
@@ -787,6 +852,9 @@ class WhereaboutAdmin(admin.ModelAdmin):
         'ends_at',
         'description',
     )
+    list_select_related = ('timesheet', 'timesheet__user', 'location')
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = (
         ('location', RelatedDropdownFilter),
         AutocompleteFilterFactory('user', 'timesheet__user'),
@@ -794,7 +862,7 @@ class WhereaboutAdmin(admin.ModelAdmin):
         ('ends_at', DateTimeRangeFilter)
     )
     search_fields = ('timesheet__user__username', 'timesheet__user__first_name', 'timesheet__user__last_name',
-                     'location__name', 'starts_at', 'ends_at', 'description')
+                     'location__name', 'description')
     ordering = ('-starts_at',)
     raw_id_fields = ('timesheet',)
 
@@ -856,15 +924,18 @@ class ContractListFilter(admin.SimpleListFilter):
     template = 'django_admin_listfilter_dropdown/dropdown_filter.html'
 
     def lookups(self, request, model_admin):
-        query = models.Contract.objects.non_polymorphic().select_related('customer', 'company')
-        return [(con.pk, str(con)) for con in query]
+        def get_choices():
+            query = models.Contract.objects.non_polymorphic().select_related('customer', 'company')
+            return [(con.pk, str(con)) for con in query]
+
+        # Contracts change rarely compared to how often the dropdown renders
+        return cache.get_or_set('performance_admin_contract_filter_choices', get_choices, 300)
 
     def queryset(self, request, queryset):
         if self.value():
             try:
                 value = int(self.value())
-            except TypeError:
-                value = None
+            except (TypeError, ValueError):
                 return queryset
 
             for choice_value, _ in self.lookup_choices:
@@ -874,33 +945,50 @@ class ContractListFilter(admin.SimpleListFilter):
         return queryset
 
 
+def _activity_performance(obj):
+    """Get the activity performance behind the given performance, if any, without extra queries."""
+    if not hasattr(obj, '_activity_performance_cache'):
+        # The polymorphic changelist already hands us real child instances,
+        # so hitting the activityperformance descriptor (and its SELECT per
+        # row) is only needed as a fallback
+        obj._activity_performance_cache = (obj if isinstance(obj, models.ActivityPerformance)
+                                           else getattr(obj, 'activityperformance', None))
+    return obj._activity_performance_cache
+
+
 @admin.register(models.Performance)
 class PerformanceParentAdmin(ExportMixin, PolymorphicParentModelAdmin):
     """Performance parent admin."""
 
     resource_class = PerformanceResource
     polymorphic_list = True
+    list_per_page = 50
+    show_full_result_count = False
 
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('contract',
                                                             'contract__customer',
                                                             'timesheet',
-                                                            'timesheet__user')
+                                                            'timesheet__user').defer('contract__description')
 
     def duration(self, obj):
-        return obj.activityperformance.duration
+        activity = _activity_performance(obj)
+        return activity.duration if activity else None
 
     def performance_type(self, obj):
-        return obj.activityperformance.performance_type
+        activity = _activity_performance(obj)
+        return activity.performance_type if activity else None
 
     def a_description(self, obj):
-        value = obj.activityperformance.description
+        activity = _activity_performance(obj)
+        value = activity.description if activity else None
         value = markdown(value) if value else value
         return value
 
     def contract_role(self, obj):
-        return obj.activityperformance.contract_role
-    
+        activity = _activity_performance(obj)
+        return activity.contract_role if activity else None
+
     @admin.action(description="Contract bulk change")
     def contract_bulk_change(self, request, queryset):
         if request.POST.get("do_action"):
@@ -942,7 +1030,7 @@ class PerformanceParentAdmin(ExportMixin, PolymorphicParentModelAdmin):
         models.StandbyPerformance,
     )
     list_filter = (
-        PolymorphicChildModelFilter,
+        CachedPolymorphicChildModelFilter,
         AutocompleteFilterFactory("contract", "contract"),
         AutocompleteFilterFactory('company', 'contract__company'),
         AutocompleteFilterFactory('customer', 'contract__customer'),
@@ -972,30 +1060,36 @@ class PerformanceParentAdmin(ExportMixin, PolymorphicParentModelAdmin):
 class PerformanceInuitsKrkParentAdmin(ExportMixin, PolymorphicParentModelAdmin):
     resource_class = InuitsKrkPerformanceResource
     polymorphic_list = True
+    list_per_page = 50
+    show_full_result_count = False
 
     def get_queryset(self, request):
         return models.Performance.objects.select_related('contract',
                                                          'contract__customer',
                                                          'timesheet',
-                                                         'timesheet__user')
+                                                         'timesheet__user').defer('contract__description')
     def link(self, obj):
         return mark_safe(f'<a href="{settings.BASE_URL}/admin/ninetofiver/performance/{obj.id}/change/">{obj}</a>')        
     link.allow_tags = True
     link.short_description = "Performance"
     
     def duration(self, obj):
-        return obj.activityperformance.duration
+        activity = _activity_performance(obj)
+        return activity.duration if activity else None
 
     def performance_type(self, obj):
-        return obj.activityperformance.performance_type
+        activity = _activity_performance(obj)
+        return activity.performance_type if activity else None
 
     def description(self, obj):
-        value = obj.activityperformance.description
+        activity = _activity_performance(obj)
+        value = activity.description if activity else None
         value = markdown(value) if value else value
         return value
 
     def contract_role(self, obj):
-        return obj.activityperformance.contract_role
+        activity = _activity_performance(obj)
+        return activity.contract_role if activity else None
 
     base_model = models.Performance
     child_models = (
@@ -1003,7 +1097,7 @@ class PerformanceInuitsKrkParentAdmin(ExportMixin, PolymorphicParentModelAdmin):
         models.StandbyPerformance,
     )
     list_filter = (
-        PolymorphicChildModelFilter,
+        CachedPolymorphicChildModelFilter,
         AutocompleteFilterFactory("contract", "contract"),
         AutocompleteFilterFactory('company', 'contract__company'),
         AutocompleteFilterFactory('customer', 'contract__customer'),
@@ -1081,6 +1175,7 @@ class InvoiceAdmin(admin.ModelAdmin):
         """Get the queryset."""
         return (super().get_queryset(request)
                 .select_related('contract', 'contract__customer')
+                .defer('contract__description')
                 .prefetch_related('invoiceitem_set'))
 
     def amount(self, obj):
@@ -1106,7 +1201,7 @@ class InvoiceAdmin(admin.ModelAdmin):
         ('period_ends_at', DateTimeRangeFilter),
     )
     search_fields = ('contract__name', 'reference', 'contract__name', 'contract__customer__name', 'contract__company__name',
-                     'description', 'date')
+                     'description')
     inlines = [
         InvoiceItemInline,
     ]
@@ -1184,12 +1279,12 @@ class UserTrainingAdmin(admin.ModelAdmin):
         return super(UserTrainingAdmin, self).change_view(*args, **kwargs)
 
     def enrolled_training_types(self, obj):
-        return format_html('<br>'.join(str(x) for x in list(
+        return format_html_join(mark_safe('<br>'), '{}', ((str(x),) for x in (
             models.TrainingType.objects.filter(country=obj.user.userinfo.country,
                                                training__user_training=obj).distinct())))
 
     def missing_mandatory_training(self, obj):
-        return format_html('<br>'.join(str(x) for x in list(
+        return format_html_join(mark_safe('<br>'), '{}', ((str(x),) for x in (
             models.TrainingType.objects.filter(country=obj.user.userinfo.country, mandatory=True).exclude(
                 training__user_training=obj).distinct())))
 
@@ -4,6 +4,7 @@ import logging
 import django_filters
 from django.contrib.admin import SimpleListFilter, widgets as admin_widgets
 from django.contrib.auth import models as auth_models
+from django.core.cache import cache
 from django_select2 import forms as select2_widgets
 from django.utils.translation import gettext_lazy as _
 from django_filters.rest_framework import FilterSet
@@ -19,13 +20,18 @@ class CompanyFilter(SimpleListFilter):
     template = 'django_admin_listfilter_dropdown/dropdown_filter.html'
 
     def lookups(self, request, model_admin):
-        companies = model_admin.model.objects.raw(f"""
-          SELECT DISTINCT ninetofiver_company.id as id, ninetofiver_company.name as name
-from (((ninetofiver_leave INNER JOIN auth_user ON ninetofiver_leave.user_id = auth_user.id)
-INNER JOIN ninetofiver_employmentcontract ON ninetofiver_employmentcontract.user_id = auth_user.id)
-INNER JOIN ninetofiver_company on ninetofiver_employmentcontract.company_id = ninetofiver_company.id);
-                """)
-        return [(c.id, c.name) for c in companies]
+        def get_choices():
+            companies = model_admin.model.objects.raw(f"""
+              SELECT DISTINCT ninetofiver_company.id as id, ninetofiver_company.name as name
+    from (((ninetofiver_leave INNER JOIN auth_user ON ninetofiver_leave.user_id = auth_user.id)
+    INNER JOIN ninetofiver_employmentcontract ON ninetofiver_employmentcontract.user_id = auth_user.id)
+    INNER JOIN ninetofiver_company on ninetofiver_employmentcontract.company_id = ninetofiver_company.id);
+                    """)
+            return [(c.id, c.name) for c in companies]
+
+        # The set of employing companies rarely changes, so don't rerun the
+        # join on every changelist render
+        return cache.get_or_set('leave_admin_company_filter_choices', get_choices, 300)
 
     def queryset(self, request, queryset):
         if self.value():
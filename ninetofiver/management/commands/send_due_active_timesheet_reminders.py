@@ -81,7 +81,7 @@ class Command(BaseCommand):
                             'channel': '@%s' % user.username,
                             'text': _('Hey there! Did you know you have %(timesheet_count)s active timesheet(s) due for submission? Please review and submit them soon!') % {'timesheet_count': len(timesheets)},
                         })
-                    except:
+                    except requests.RequestException:
                         log.error('Could not send mattermost notification!', exc_info=True)
 
 
@@ -91,5 +91,5 @@ class Command(BaseCommand):
                             'channel': '@%s' % user.username,
                             'text': _('Hey there! Did you know you have %(timesheet_count)s active timesheet(s) due for submission? Please review and submit them soon!') % {'timesheet_count': len(timesheets)},
                         })
-                    except:
+                    except requests.RequestException:
                         log.error('Could not send rocketchat notification!', exc_info=True)
\ No newline at end of file
@@ -47,7 +47,7 @@ class Command(BaseCommand):
                         'channel': '@%s' % user.username,
                         'text': _('Hi there! It looks like you didn\'t log any performance yesterday. Did you forget to add something? Maybe you should take a look!'),
                     })
-                except:
+                except requests.RequestException:
                     log.error('Could not send mattermost notification!', exc_info=True)
 
             if settings.ROCKETCHAT_INCOMING_WEBHOOK_URL and settings.ROCKETCHAT_PERFORMANCE_REMINDER_NOTIFICATION_ENABLED:
@@ -56,5 +56,5 @@ class Command(BaseCommand):
                         'channel': '@%s' % user.username,
                         'text': _('Hi there! It looks like you didn\'t log any performance yesterday. Did you forget to add something? Maybe you should take a look!'),
                     })
-                except:
+                except requests.RequestException:
                     log.error('Could not send rocketchat notification!', exc_info=True)
\ No newline at end of file
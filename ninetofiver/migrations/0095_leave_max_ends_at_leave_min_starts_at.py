@@ -0,0 +1,37 @@
+# Generated by Django 4.0 on 2026-08-31 09:12
+
+from django.db import migrations, models
+from django.db.models import Max, Min, OuterRef, Subquery
+
+
+def populate_leave_date_range(apps, schema_editor):
+    """Populate the denormalized leave date range from the existing leave dates."""
+    Leave = apps.get_model('ninetofiver', 'Leave')
+    LeaveDate = apps.get_model('ninetofiver', 'LeaveDate')
+
+    leave_dates = LeaveDate.objects.filter(leave=OuterRef('pk')).order_by().values('leave')
+    Leave.objects.update(
+        min_starts_at=Subquery(leave_dates.annotate(value=Min('starts_at')).values('value')),
+        max_ends_at=Subquery(leave_dates.annotate(value=Max('ends_at')).values('value')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ninetofiver', '0094_alter_userinfo_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='leave',
+            name='max_ends_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='leave',
+            name='min_starts_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate_leave_date_range, migrations.RunPython.noop),
+    ]
@@ -571,6 +571,10 @@ class Leave(BaseModel):
     description = models.TextField(max_length=255, blank=True, null=True)
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_DRAFT)
     attachments = models.ManyToManyField(Attachment, blank=True)
+    # Denormalized date range of the attached leave dates, kept in sync by
+    # signals so filtering/ordering leaves by date does not require a join
+    min_starts_at = models.DateTimeField(blank=True, null=True, db_index=True, editable=False)
+    max_ends_at = models.DateTimeField(blank=True, null=True, db_index=True, editable=False)
 
     class Meta(BaseModel.Meta):
         permissions = (
@@ -1,4 +1,5 @@
 """Notifications."""
+from django.core.mail import get_connection
 from django.utils.translation import gettext_lazy as _
 from ninetofiver import models
 from ninetofiver.utils import get_users_with_permission, send_mail
@@ -24,4 +25,54 @@ def send_attachments_modified_notification(attachments, action='added', timeshee
                     'attachments': attachments,
                     'action': action,
                 }
-            )
\ No newline at end of file
+            )
+
+
+def get_leave_status_subject(leave):
+    """Build the subject line for a leave status update."""
+    subject = _('Leave status updated: %(status)s') % {'status': leave.status}
+
+    # The denormalized date range is maintained at the SQL level, so no
+    # per-leave queries are needed to mention the dates
+    if leave.min_starts_at and leave.max_ends_at:
+        subject = '%s [%s - %s]' % (subject, leave.min_starts_at.date(), leave.max_ends_at.date())
+
+    return subject
+
+
+def send_leave_status_notifications(leaves):
+    """Notify users about the status of the given leaves, reusing a single mail connection."""
+    with get_connection() as connection:
+        for leave in leaves:
+            description_text = leave.description.split() if leave.description else None
+            if description_text and ('#test' in description_text):
+                continue
+
+            if leave.user.email:
+                send_mail(
+                    leave.user.email,
+                    get_leave_status_subject(leave),
+                    'ninetofiver/emails/leave_status_updated.pug',
+                    context={
+                        'user': leave.user,
+                        'leave': leave,
+                    },
+                    connection=connection
+                )
+
+
+def send_timesheet_status_notifications(timesheets):
+    """Notify users about the status of the given timesheets, reusing a single mail connection."""
+    with get_connection() as connection:
+        for timesheet in timesheets:
+            if timesheet.user.email:
+                send_mail(
+                    timesheet.user.email,
+                    _('Timesheet status updated: %(status)s') % {'status': timesheet.status},
+                    'ninetofiver/emails/timesheet_status_updated.pug',
+                    context={
+                        'user': timesheet.user,
+                        'timesheet': timesheet,
+                    },
+                    connection=connection
+                )
\ No newline at end of file
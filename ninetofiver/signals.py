@@ -2,7 +2,8 @@
 from django_auth_ldap.backend import populate_user
 from django.contrib.auth import models as auth_models
 from django.dispatch import receiver
-from django.db.models.signals import post_save, pre_save, m2m_changed, pre_delete
+from django.db.models import Max, Min
+from django.db.models.signals import post_save, pre_save, m2m_changed, pre_delete, post_delete
 from django.utils.translation import gettext_lazy as _
 from ninetofiver import models, notifications
 from ninetofiver.utils import send_mail, get_users_with_permission
@@ -58,7 +59,7 @@ def on_leave_pre_save(sender, instance, created=False, **kwargs):
             if instance.user.email:
                 send_mail(
                     instance.user.email,
-                    _('Leave status updated: %(status)s') % {'status': instance.status},
+                    notifications.get_leave_status_subject(instance),
                     'ninetofiver/emails/leave_status_updated.pug',
                     context={
                         'user': instance.user,
@@ -67,6 +68,41 @@ def on_leave_pre_save(sender, instance, created=False, **kwargs):
                 )
 
 
+def sync_leave_date_range(leave_id):
+    """Recompute the denormalized date range for the given leave."""
+    date_range = (models.LeaveDate.objects
+                  .filter(leave_id=leave_id)
+                  .aggregate(min_starts_at=Min('starts_at'), max_ends_at=Max('ends_at')))
+    models.Leave.objects.filter(pk=leave_id).update(**date_range)
+
+
+@receiver(pre_save, sender=models.LeaveDate)
+def on_leave_date_pre_save(sender, instance, created=False, **kwargs):
+    """Process pre-save event for a leave date."""
+    # Remember the previous parent leave so its date range can be recomputed
+    # as well when a leave date is moved to another leave
+    instance._previous_leave_id = None
+
+    if instance.pk and instance.is_dirty(check_relationship=True):
+        dirty = instance.get_dirty_fields(check_relationship=True)
+        old_leave_id = dirty.get('leave', None)
+        if old_leave_id and (old_leave_id != instance.leave_id):
+            instance._previous_leave_id = old_leave_id
+
+
+@receiver(post_save, sender=models.LeaveDate)
+@receiver(post_delete, sender=models.LeaveDate)
+def on_leave_date_post_change(sender, instance, **kwargs):
+    """Process post-save/post-delete events for a leave date."""
+    # Keep the denormalized date range on the parent leave in sync
+    sync_leave_date_range(instance.leave_id)
+
+    previous_leave_id = getattr(instance, '_previous_leave_id', None)
+    if previous_leave_id:
+        sync_leave_date_range(previous_leave_id)
+        instance._previous_leave_id = None
+
+
 @receiver(pre_save, sender=models.Timesheet)
 def on_timesheet_pre_save(sender, instance, created=False, **kwargs):
     """Process pre-save event for a timesheet."""
@@ -391,7 +391,7 @@ class TimesheetOverviewTable(BaseTable):
         # contract = models.EmploymentContract.objects.get(started_at__lte=f"{today.year}-{f'0{today.month}' if today.month < 10 else today.month}-01",ended_at__gte=f"{today.year}-{f'0{today.month}' if today.month < 10 else today.month}-{last.day}",user=record["timesheet"].user.id)
         try:
             perc = floor((100 - (record["range_info_to_day"]["remaining_hours"] / record["range_info_to_day"]["work_hours"] * 100))*10)/10
-        except:
+        except (KeyError, TypeError, ZeroDivisionError):
             perc = -1
         c = "244,85,85" if perc < 25 else "244,154,85" if perc < 50 else "244,231,85" if perc<75 else "165,244,85" if perc<90 else "67,232,55"
         if perc != -1:
@@ -401,7 +401,7 @@ class TimesheetOverviewTable(BaseTable):
     def render_percentage_complete(self, record,value,column):
         try:
             perc = floor((100 - (record["range_info"]["remaining_hours"] / record["range_info"]["work_hours"] * 100))*10)/10
-        except:
+        except (KeyError, TypeError, ZeroDivisionError):
             perc = -1
         c = "244,85,85" if perc < 25 else "244,154,85" if perc < 50 else "244,231,85" if perc<75 else "165,244,85" if perc<90 else "67,232,55"
         if perc != -1:
@@ -485,17 +485,17 @@ class UserRangeInfoTable(BaseTable):
             buttons.append(('<a class="button" href="%(url)s?' +
                             'user__id__exact=%(user)s&' +
                             'status__exact=%(status)s&' +
-                            'leavedate__starts_at__range__gte_0=%(leavedate__starts_at__range__gte_0)s&' +
-                            'leavedate__starts_at__range__gte_1=%(leavedate__starts_at__range__gte_1)s&' +
-                            'leavedate__starts_at__range__lte_0=%(leavedate__starts_at__range__lte_0)s&' +
-                            'leavedate__starts_at__range__lte_1=%(leavedate__starts_at__range__lte_1)s">Leave</a>') % {
+                            'min_starts_at__range__lte_0=%(min_starts_at__range__lte_0)s&' +
+                            'min_starts_at__range__lte_1=%(min_starts_at__range__lte_1)s&' +
+                            'max_ends_at__range__gte_0=%(max_ends_at__range__gte_0)s&' +
+                            'max_ends_at__range__gte_1=%(max_ends_at__range__gte_1)s">Leave</a>') % {
                 'url': reverse('admin:ninetofiver_leave_changelist'),
                 'user': record['user'].id,
                 'status': models.STATUS_APPROVED,
-                'leavedate__starts_at__range__gte_0': record['date'].strftime('%Y-%m-%d'),
-                'leavedate__starts_at__range__gte_1': '00:00:00',
-                'leavedate__starts_at__range__lte_0': record['date'].strftime('%Y-%m-%d'),
-                'leavedate__starts_at__range__lte_1': '23:59:59',
+                'min_starts_at__range__lte_0': record['date'].strftime('%Y-%m-%d'),
+                'min_starts_at__range__lte_1': '23:59:59',
+                'max_ends_at__range__gte_0': record['date'].strftime('%Y-%m-%d'),
+                'max_ends_at__range__gte_1': '00:00:00',
             })
 
         return format_html('%s' % ('&nbsp;'.join(buttons)))
@@ -592,17 +592,17 @@ class UserLeaveOverviewTable(BaseTable):
         buttons.append(('<a class="button" href="%(url)s?' +
                         'user__id__exact=%(user)s&' +
                         'status__exact=%(status)s&' +
-                        'leavedate__starts_at__gte_0=%(leavedate__starts_at__gte_0)s&' +
-                        'leavedate__starts_at__gte_1=%(leavedate__starts_at__gte_1)s&' +
-                        'leavedate__starts_at__lte_0=%(leavedate__starts_at__lte_0)s&' +
-                        'leavedate__starts_at__lte_1=%(leavedate__starts_at__lte_1)s">Leave</a>') % {
+                        'min_starts_at__range__lte_0=%(min_starts_at__range__lte_0)s&' +
+                        'min_starts_at__range__lte_1=%(min_starts_at__range__lte_1)s&' +
+                        'max_ends_at__range__gte_0=%(max_ends_at__range__gte_0)s&' +
+                        'max_ends_at__range__gte_1=%(max_ends_at__range__gte_1)s">Leave</a>') % {
             'url': reverse('admin:ninetofiver_leave_changelist'),
             'user': record['user'].id,
             'status': models.STATUS_APPROVED,
-            'leavedate__starts_at__gte_0': date_range[0].strftime('%Y-%m-%d'),
-            'leavedate__starts_at__gte_1': '00:00:00',
-            'leavedate__starts_at__lte_0': date_range[1].strftime('%Y-%m-%d'),
-            'leavedate__starts_at__lte_1': '23:59:59',
+            'min_starts_at__range__lte_0': date_range[1].strftime('%Y-%m-%d'),
+            'min_starts_at__range__lte_1': '23:59:59',
+            'max_ends_at__range__gte_0': date_range[0].strftime('%Y-%m-%d'),
+            'max_ends_at__range__gte_1': '00:00:00',
         })
 
         return format_html('%s' % ('&nbsp;'.join(buttons)))
@@ -722,17 +722,17 @@ class UserWorkRatioOverviewTable(BaseTable):
             buttons.append(('<a class="button" href="%(url)s?' +
                             'user__id__exact=%(user)s&' +
                             'status__exact=%(status)s&' +
-                            'leavedate__starts_at__range__gte_0=%(leavedate__starts_at__range__gte_0)s&' +
-                            'leavedate__starts_at__range__gte_1=%(leavedate__starts_at__range__gte_1)s&' +
-                            'leavedate__starts_at__range__lte_0=%(leavedate__starts_at__range__lte_0)s&' +
-                            'leavedate__starts_at__range__lte_1=%(leavedate__starts_at__range__lte_1)s">Leave</a>') % {
+                            'min_starts_at__range__lte_0=%(min_starts_at__range__lte_0)s&' +
+                            'min_starts_at__range__lte_1=%(min_starts_at__range__lte_1)s&' +
+                            'max_ends_at__range__gte_0=%(max_ends_at__range__gte_0)s&' +
+                            'max_ends_at__range__gte_1=%(max_ends_at__range__gte_1)s">Leave</a>') % {
                 'url': reverse('admin:ninetofiver_leave_changelist'),
                 'user': record['user'].id,
                 'status': models.STATUS_APPROVED,
-                'leavedate__starts_at__range__gte_0': date_range[0].strftime('%Y-%m-%d'),
-                'leavedate__starts_at__range__gte_1': '00:00:00',
-                'leavedate__starts_at__range__lte_0': date_range[1].strftime('%Y-%m-%d'),
-                'leavedate__starts_at__range__lte_1': '23:59:59',
+                'min_starts_at__range__lte_0': date_range[1].strftime('%Y-%m-%d'),
+                'min_starts_at__range__lte_1': '23:59:59',
+                'max_ends_at__range__gte_0': date_range[0].strftime('%Y-%m-%d'),
+                'max_ends_at__range__gte_1': '00:00:00',
             })
 
         return format_html('%s' % ('&nbsp;'.join(buttons)))
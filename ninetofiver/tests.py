@@ -169,6 +169,62 @@ class ContractUserGroupTests(AuthenticatedAPITestCase):
         self.assertEqual(contract.contractuser_set.count(), 0)
 
 
+class LeaveDateRangeTests(AuthenticatedAPITestCase):
+    """Leave date range tests."""
+
+    def test_denormalized_date_range_handling(self):
+        """Test automatic handling of the denormalized leave date range."""
+        # Initial data setup
+        user = factories.UserFactory.create()
+        leave_type = factories.LeaveTypeFactory.create()
+        timesheet = factories.OpenTimesheetFactory.create(user=user, year=2018, month=3)
+        leave = factories.LeaveFactory.create(user=user, leave_type=leave_type)
+        other_leave = factories.LeaveFactory.create(user=user, leave_type=leave_type)
+
+        # A leave without leave dates should have no date range
+        self.assertIsNone(leave.min_starts_at)
+        self.assertIsNone(leave.max_ends_at)
+
+        # Creating leave dates should update the date range of the leave
+        first_date = factories.LeaveDateFactory.create(
+            leave=leave, timesheet=timesheet,
+            starts_at=datetime.datetime(2018, 3, 20, 9, 0, tzinfo=utc),
+            ends_at=datetime.datetime(2018, 3, 20, 17, 30, tzinfo=utc))
+        second_date = factories.LeaveDateFactory.create(
+            leave=leave, timesheet=timesheet,
+            starts_at=datetime.datetime(2018, 3, 21, 9, 0, tzinfo=utc),
+            ends_at=datetime.datetime(2018, 3, 21, 17, 30, tzinfo=utc))
+
+        leave.refresh_from_db()
+        self.assertEqual(leave.min_starts_at, first_date.starts_at)
+        self.assertEqual(leave.max_ends_at, second_date.ends_at)
+
+        # Updating a leave date should update the date range of the leave
+        second_date.ends_at = datetime.datetime(2018, 3, 21, 18, 0, tzinfo=utc)
+        second_date.save()
+
+        leave.refresh_from_db()
+        self.assertEqual(leave.max_ends_at, second_date.ends_at)
+
+        # Moving a leave date to another leave should update the date range of both leaves
+        second_date.leave = other_leave
+        second_date.save()
+
+        leave.refresh_from_db()
+        other_leave.refresh_from_db()
+        self.assertEqual(leave.min_starts_at, first_date.starts_at)
+        self.assertEqual(leave.max_ends_at, first_date.ends_at)
+        self.assertEqual(other_leave.min_starts_at, second_date.starts_at)
+        self.assertEqual(other_leave.max_ends_at, second_date.ends_at)
+
+        # Deleting the final leave date should clear the date range of the leave
+        second_date.delete()
+
+        other_leave.refresh_from_db()
+        self.assertIsNone(other_leave.min_starts_at)
+        self.assertIsNone(other_leave.max_ends_at)
+
+
 class AdminReportViewTests(AuthenticatedAPITestCase):
     """Admin report view tests."""
 
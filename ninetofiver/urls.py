@@ -134,6 +134,9 @@ urlpatterns += [
     re_path(r'^contract-autocomplete/$',
         views.ContractAutocomplete.as_view(),
         name='contract-autocomplete',),
+    re_path(r'^user-autocomplete/$',
+        views.UserAutocomplete.as_view(),
+        name='user-autocomplete',),
 ]
 
 
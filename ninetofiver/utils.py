@@ -1,6 +1,7 @@
 """Utils."""
 import copy
 import datetime
+import functools
 import os
 from calendar import monthrange
 from importlib import import_module
@@ -19,6 +20,7 @@ def get_django_environment():
     return os.getenv('ENVIRONMENT', DEFAULT_DJANGO_ENVIRONMENT)
 
 
+@functools.lru_cache(maxsize=1)
 def get_django_configuration():
     """Get the django configuration name based on the current environment."""
     env = get_django_environment()
@@ -86,7 +88,7 @@ def format_duration(hours):
     return '%(amount).2fh (%(days).2fd)' % {'amount': hours, 'days': hours_to_days(hours)}
 
 
-def send_mail(recipients, subject, template, context={}):
+def send_mail(recipients, subject, template, context={}, connection=None):
     """Send a mail from a template to the given recipients."""
     from ninetofiver.settings import DEFAULT_FROM_EMAIL
     from django_settings_export import _get_exported_settings
@@ -103,7 +105,8 @@ def send_mail(recipients, subject, template, context={}):
         DEFAULT_FROM_EMAIL,
         recipients,
         fail_silently=False,
-        html_message=message
+        html_message=message,
+        connection=connection
     )
 
 
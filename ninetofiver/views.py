@@ -180,6 +180,21 @@ class ContractAutocomplete(autocomplete.Select2QuerySetView):
 
         return qs
 
+
+class UserAutocomplete(autocomplete.Select2QuerySetView):
+    def get_queryset(self):
+        if not self.request.user.is_staff:
+            return auth_models.User.objects.none()
+
+        qs = auth_models.User.objects.all()
+
+        if self.q:
+            qs = qs.filter(Q(username__icontains=self.q) |
+                           Q(first_name__icontains=self.q) |
+                           Q(last_name__icontains=self.q))
+
+        return qs
+
 # Admin-only
 @staff_member_required
 def admin_leave_approve_view(request, leave_pk):